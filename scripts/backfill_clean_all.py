@@ -3,31 +3,80 @@ r"""
 Batch-clean DOL LCA disclosure Excel files (FY2020–FY2025, Q1–Q4) into COPY-friendly CSVs.
 
 - Reads each .xlsx in input-dir matching pattern like: LCA_Disclosure_Data_FY2020_Q1.xlsx
+- Caches the selected columns next to each .xlsx as <file>.xlsx.parquet; reruns of the same
+  --sheet read the parquet instead of re-parsing the workbook. Caches are rebuilt when the
+  .xlsx changes or SOURCE_TO_TARGET is edited. A read-only input-dir just means no caching
 - Normalizes columns to your DB fields
 - Safe date parsing (strings + Excel serial dates)
 - Computes wage_annual from wage_rate_from + wage_unit
 - Writes per-file CSV with NULL as \N (good for COPY ... NULL '\N')
+- Cleans files in parallel, one worker process per file (--workers caps memory use)
 - Writes a manifest.csv summary
 
+Requires pandas>=2.2, pyarrow and python-calamine (Rust-backed xlsx reader):
+  pip install pandas pyarrow python-calamine
+Without python-calamine the pandas engine falls back to openpyxl in read-only mode (much slower).
+--engine polars additionally needs polars; it cleans every file's parquet cache in one batched
+polars run (pl.collect_all) instead of one pandas process per file. It only recognises the date
+formats in PL_DATE_FORMATS (plus Excel serials); other date strings come out NULL, where the
+pandas engine still parses them with dateutil:
+  pip install polars
+
 Run:
   python scripts/backfill_clean_all.py --input-dir data/raw --output-dir output/clean
+  python scripts/backfill_clean_all.py --input-dir data/raw --output-dir output/clean --engine polars
 """
 
 from __future__ import annotations
 
 import argparse
+import collections
+import datetime as dt
+import functools
+import hashlib
+import multiprocessing as mp
 import os
 import re
-from typing import Dict, List, Optional, Tuple
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+try:
+    import python_calamine  # noqa: F401  (backs pandas' engine="calamine")
+    HAVE_CALAMINE = True
+except ImportError:  # fall back to openpyxl in read-only mode
+    HAVE_CALAMINE = False
+
+try:
+    import numexpr as ne
+except ImportError:  # optional: fused multiply + guardrail in compute_wage_annual
+    ne = None
+
+try:
+    import polars as pl
+except ImportError:  # only needed for --engine polars
+    pl = None
+
+
+# Compiled once; reused by norm_col and the vectorized pandas/polars cleaners
+_NONWORD = re.compile(r"[^\w]+")
+_UNDERS = re.compile(r"_+")
+_MONEY = re.compile(r"[\$,]")
+_FY_Q = re.compile(r"FY(\d{4})_Q([1-4])", flags=re.IGNORECASE)
 
 
 def norm_col(name: str) -> str:
     s = str(name).strip().lower()
-    s = re.sub(r"[^\w]+", "_", s)
-    s = re.sub(r"_+", "_", s).strip("_")
+    s = _NONWORD.sub("_", s)
+    s = _UNDERS.sub("_", s).strip("_")
     return s
 
 
@@ -100,6 +149,33 @@ WAGE_FACTORS = {
     "day": 260.0, "daily": 260.0,
 }
 
+# Normalized wage-unit spellings -> canonical WAGE_FACTORS key
+WAGE_UNIT_ALIASES: Dict[str, str] = {
+    "biweekly": "bi_weekly",
+    "semi_month": "semi_monthly",
+    "hr": "hour", "per_hour": "hour",
+    "wk": "week", "per_week": "week",
+    "mo": "month", "per_month": "month",
+    "yr": "year", "per_year": "year", "annual": "year",
+    "daily": "day", "per_day": "day",
+}
+
+TEXT_COLS: List[str] = [
+    "case_number", "case_status", "employer_name", "job_title", "soc_code", "soc_title",
+    "worksite_city", "worksite_state", "wage_unit",
+]
+
+
+# Formats tried as a fast path before falling back to per-element inference.
+# DOL files are overwhelmingly one of these; calamine renders datetime cells as the second.
+DATE_FAST_FORMATS: List[Tuple[re.Pattern, str]] = [
+    (re.compile(r"\d{4}-\d{2}-\d{2}"), "%Y-%m-%d"),
+    (re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}"), "%Y-%m-%d %H:%M:%S"),
+    (re.compile(r"\d{2}/\d{2}/\d{4}"), "%m/%d/%Y"),
+]
+DATE_SAMPLE_SIZE = 256
+DATE_FAST_THRESHOLD = 0.95
+
 
 def clean_text_series(s: pd.Series) -> pd.Series:
     s = s.astype("string")
@@ -110,21 +186,43 @@ def clean_text_series(s: pd.Series) -> pd.Series:
 
 def coerce_numeric_series(s: pd.Series) -> pd.Series:
     s = s.astype("string")
-    s = s.str.replace(r"[\$,]", "", regex=True).str.strip()
+    s = s.str.replace(_MONEY, "", regex=True).str.strip()
     s = s.replace({"": pd.NA})
-    return pd.to_numeric(s, errors="coerce")
+    return pd.to_numeric(s, errors="coerce").astype("Float64")
+
+
+def detect_date_format(ss: pd.Series) -> Optional[str]:
+    sample = ss.dropna().head(DATE_SAMPLE_SIZE).tolist()
+    if not sample:
+        return None
+    for pattern, fmt in DATE_FAST_FORMATS:
+        hits = sum(1 for v in sample if pattern.fullmatch(v))
+        if hits > DATE_FAST_THRESHOLD * len(sample):
+            return fmt
+    return None
 
 
 def parse_mixed_date_series(s: pd.Series) -> pd.Series:
+    if pd.api.types.is_datetime64_any_dtype(s):
+        return s
+
     ss = s.astype("string").str.strip()
     ss = ss.replace({"": pd.NA, "nan": pd.NA, "NaN": pd.NA})
 
-    is_serial = ss.str.fullmatch(r"\d{4,6}")
-    serial_vals = pd.to_numeric(ss.where(is_serial), errors="coerce")
-
-    out = pd.to_datetime(ss, errors="coerce", infer_datetime_format=True)
-
-    needs_serial = out.isna() & serial_vals.notna() & serial_vals.between(18000, 60000)
+    fmt = detect_date_format(ss)
+    if fmt is None:
+        # No dominant format: parse element-wise rather than guessing one from the first value
+        out = pd.to_datetime(ss, format="mixed", errors="coerce", cache=True)
+    else:
+        out = pd.to_datetime(ss, format=fmt, errors="coerce", cache=True)
+        residual = out.isna() & ss.notna()
+        if residual.any():
+            out.loc[residual] = pd.to_datetime(
+                ss.loc[residual], format="mixed", errors="coerce", cache=True
+            )
+
+    serial_vals = pd.to_numeric(ss, errors="coerce")
+    needs_serial = out.isna() & serial_vals.between(18000, 60000) & (serial_vals % 1 == 0)
     if needs_serial.any():
         out.loc[needs_serial] = pd.to_datetime(
             serial_vals.loc[needs_serial],
@@ -135,41 +233,43 @@ def parse_mixed_date_series(s: pd.Series) -> pd.Series:
     return out
 
 
-def normalize_wage_unit(u: Optional[str]) -> Optional[str]:
-    if u is None or (isinstance(u, float) and np.isnan(u)):
-        return None
-    s = str(u).strip().lower()
-    s = re.sub(r"[^\w]+", "_", s)
-    s = re.sub(r"_+", "_", s).strip("_")
-
-    if s in ("bi_weekly", "biweekly"):
-        return "bi_weekly"
-    if s in ("semi_monthly", "semi_month"):
-        return "semi_monthly"
-    if s in ("hour", "hr", "per_hour"):
-        return "hour"
-    if s in ("week", "wk", "per_week"):
-        return "week"
-    if s in ("month", "mo", "per_month"):
-        return "month"
-    if s in ("year", "yr", "per_year", "annual"):
-        return "year"
-    if s in ("day", "daily", "per_day"):
-        return "day"
-    return s or None
+def normalize_wage_unit_series(u: pd.Series) -> pd.Series:
+    s = (
+        u.astype("string").str.strip().str.lower()
+        .str.replace(_NONWORD, "_", regex=True)
+        .str.replace(_UNDERS, "_", regex=True)
+        .str.strip("_")
+        .replace({"": pd.NA})
+    )
+    return s.map(WAGE_UNIT_ALIASES).fillna(s)
 
 
-def compute_wage_annual(wage_from: pd.Series, wage_to: pd.Series, wage_unit: pd.Series) -> pd.Series:
-    base = wage_from.where(wage_from.notna(), wage_to)
+WAGE_ANNUAL_EXPR = "where((base * f >= 1000) & (base * f <= 5000000), base * f, nan)"
 
-    unit_norm = wage_unit.apply(normalize_wage_unit).astype("string")
-    factors = unit_norm.map(lambda x: WAGE_FACTORS.get(str(x), np.nan))
 
-    annual = base.astype(float) * factors.astype(float)
+def annualize(base: pd.Series, factors: pd.Series) -> pd.Series:
+    if ne is not None:
+        annual = ne.evaluate(WAGE_ANNUAL_EXPR, local_dict={
+            "base": base.to_numpy(dtype="float64", na_value=np.nan),
+            "f": factors.to_numpy(dtype="float64", na_value=np.nan),
+            "nan": np.nan,
+        })
+        # NaN (missing input, or failed guardrail) comes back as pd.NA
+        return pd.Series(annual, index=base.index, dtype="Float64")
 
+    annual = base * factors
     # Guardrails: drop absurd values
-    annual = annual.where((annual.isna()) | ((annual >= 1000) & (annual <= 5_000_000)), np.nan)
-    return annual.round(2)
+    return annual.where((annual.isna()) | ((annual >= 1000) & (annual <= 5_000_000)), pd.NA)
+
+
+def compute_wage_annual(wage_from: pd.Series, wage_to: pd.Series, wage_unit: pd.Series) -> pd.Series:
+    # Nullable Float64 inputs (pd.NA, masked-array kernels); no astype(float) copies
+    base = wage_from.astype("Float64").fillna(wage_to.astype("Float64"))
+
+    unit_norm = normalize_wage_unit_series(wage_unit)
+    factors = unit_norm.map(WAGE_FACTORS).astype("Float64")
+
+    return annualize(base, factors).round(2)
 
 
 def coalesce_duplicate_columns(df: pd.DataFrame) -> pd.DataFrame:
@@ -179,46 +279,180 @@ def coalesce_duplicate_columns(df: pd.DataFrame) -> pd.DataFrame:
     """
     if df.columns.is_unique:
         return df
-    out = {}
-    for name in pd.unique(df.columns):
-        cols = df.loc[:, df.columns == name]
-        if isinstance(cols, pd.Series):
-            out[name] = cols
-        else:
-            out[name] = cols.bfill(axis=1).iloc[:, 0]
-    return pd.DataFrame(out)
+    dup = df.columns.duplicated()
+    return df.loc[:, ~dup].assign(**{
+        name: df[name].bfill(axis=1).iloc[:, 0]
+        for name in df.columns[dup].unique()
+    })
+
+
+def is_source_col(name) -> bool:
+    """usecols predicate: keep only the xlsx columns that map to a DB field."""
+    return norm_col(name) in SOURCE_TO_TARGET
+
+
+DATE_COLS = ("received_date", "decision_date")
+
+
+class _XlsxDtypes(collections.defaultdict):
+    """
+    read_excel dtypes picked by header name, so no header peek is needed before the read:
+    strings, except date columns, which keep the engine's datetime64 when it produces one.
+    """
+
+    def __missing__(self, name):
+        return None if SOURCE_TO_TARGET.get(norm_col(name)) in DATE_COLS else "string"
+
+
+def dedupe_header(header: Sequence) -> List:
+    """Rename repeated header names X, X.1, X.2, ... the way pandas' readers do."""
+    counts: Dict = collections.defaultdict(int)
+    out = []
+    for name in header:
+        if name is not None:
+            n = counts[name]
+            while n:
+                counts[name] = n + 1
+                name = f"{name}.{n}"
+                n = counts[name]
+            counts[name] = n + 1
+        out.append(name)
+    return out
+
 
+def read_xlsx_openpyxl(path: str, sheet: int | str) -> pd.DataFrame:
+    """openpyxl read-only/values-only fallback for when python-calamine is not installed."""
+    import openpyxl
 
-def infer_usecols_from_xlsx(path: str, sheet: int | str) -> Optional[List[str]]:
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True, keep_links=False)
     try:
-        header_df = pd.read_excel(path, sheet_name=sheet, nrows=0, engine="openpyxl")
-    except Exception:
+        ws = wb.worksheets[sheet] if isinstance(sheet, int) else wb[sheet]
+        rows = ws.iter_rows(values_only=True)
+        # Repeated headers become X.1, ... (as with calamine) so no two columns share a name
+        header = dedupe_header(next(rows, None) or ())
+        idx = [i for i, h in enumerate(header) if h is not None and is_source_col(h)]
+        data = [
+            tuple(r[i] if i < len(r) else None for i in idx)
+            for r in rows
+            if any(v is not None for v in r)  # read-only sheets can report trailing blank rows
+        ]
+    finally:
+        wb.close()
+    return pd.DataFrame(data, columns=[header[i] for i in idx])
+
+
+def read_xlsx(path: str, sheet: int | str) -> pd.DataFrame:
+    """Mapped columns only; non-date columns as strings, date columns native when the engine allows."""
+    if HAVE_CALAMINE:
+        df = pd.read_excel(path, sheet_name=sheet, engine="calamine", dtype=_XlsxDtypes(), usecols=is_source_col)
+    else:
+        df = read_xlsx_openpyxl(path, sheet)
+
+    for c in df.columns:
+        if not pd.api.types.is_datetime64_any_dtype(df[c]):
+            df[c] = df[c].astype("string")
+    return df
+
+
+# Parquet schema metadata recording what the cache was built from: the sheet, and a
+# fingerprint of the column mapping (editing SOURCE_TO_TARGET changes which columns
+# get selected, so older caches must be rebuilt rather than read with the old column set)
+CACHE_SHEET_KEY = b"lca_sheet"
+CACHE_MAPPING_KEY = b"lca_mapping"
+MAPPING_FINGERPRINT = hashlib.sha1(repr(sorted(SOURCE_TO_TARGET.items())).encode()).hexdigest().encode()
+
+
+def cache_metadata(sheet: int | str) -> Dict[bytes, bytes]:
+    return {CACHE_SHEET_KEY: repr(sheet).encode(), CACHE_MAPPING_KEY: MAPPING_FINGERPRINT}
+
+
+def parquet_sibling(in_path: str) -> str:
+    return in_path + ".parquet"
+
+
+def cache_is_fresh(in_path: str, sheet: int | str) -> bool:
+    """
+    True if the parquet sibling is newer than the xlsx and was built from the same sheet
+    with the current SOURCE_TO_TARGET mapping.
+    """
+    cache_path = parquet_sibling(in_path)
+    if not os.path.exists(cache_path) or os.path.getmtime(cache_path) < os.path.getmtime(in_path):
+        return False
+    metadata = pq.read_schema(cache_path).metadata or {}
+    return all(metadata.get(k) == v for k, v in cache_metadata(sheet).items())
+
+
+def xlsx_to_table(in_path: str, sheet: int | str) -> Tuple[pd.DataFrame, pa.Table]:
+    """Read the workbook once; also return it as an Arrow table tagged with cache_metadata()."""
+    df = read_xlsx(in_path, sheet=sheet)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), **cache_metadata(sheet)})
+    return df, table
+
+
+def write_parquet(table: pa.Table, path: str) -> bool:
+    """
+    Write via a temp file + rename so an interrupted write never looks like a fresh cache.
+    Returns False (after logging) if the directory can't be written, e.g. a read-only input-dir.
+    """
+    tmp_path = path + ".tmp"
+    try:
+        pq.write_table(table, tmp_path, compression="zstd")
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Not caching {path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+    return True
+
+
+def cache_xlsx_as_parquet(in_path: str, sheet: int | str) -> pd.DataFrame:
+    """
+    Read the workbook once and materialize the selected columns as <in_path>.parquet,
+    so later runs over the same file skip xlsx parsing entirely.
+    """
+    df, table = xlsx_to_table(in_path, sheet)
+    write_parquet(table, parquet_sibling(in_path))
+    return df
+
+
+def read_cached_parquet(in_path: str, sheet: int | str) -> Optional[pd.DataFrame]:
+    if not cache_is_fresh(in_path, sheet):
         return None
-    norm_map = {c: norm_col(c) for c in header_df.columns}
-    needed = set(SOURCE_TO_TARGET.keys())
-    keep = [c for c in header_df.columns if norm_map.get(c) in needed]
-    return keep or None
+    # The cache holds exactly the columns the current mapping selects, so no xlsx header peek is needed
+    return pd.read_parquet(parquet_sibling(in_path))
 
 
-def load_and_clean(df: pd.DataFrame) -> pd.DataFrame:
+# Quarterly files share a handful of header layouts, so both lookups are memoized
+# on the tuple of column names. Callers must not mutate the returned values.
+@functools.lru_cache(maxsize=None)
+def _build_rename_map(cols: Tuple[str, ...]) -> Dict[str, str]:
     rename_map: Dict[str, str] = {}
-    for c in df.columns:
+    for c in cols:
         nc = norm_col(c)
         if nc in SOURCE_TO_TARGET:
             rename_map[c] = SOURCE_TO_TARGET[nc]
+    return rename_map
+
+
+@functools.lru_cache(maxsize=None)
+def _missing_target_cols(cols: Tuple[str, ...]) -> Tuple[str, ...]:
+    present = set(cols)
+    return tuple(col for col in TARGET_COLS if col not in present)
 
-    df = df.rename(columns=rename_map)
+
+def load_and_clean(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.rename(columns=_build_rename_map(tuple(df.columns)))
     df = coalesce_duplicate_columns(df)
 
-    for col in TARGET_COLS:
-        if col not in df.columns:
-            df[col] = pd.NA
+    for col in _missing_target_cols(tuple(df.columns)):
+        df[col] = pd.NA
 
     df = df[TARGET_COLS].copy()
 
     # text
-    for col in ["case_number", "case_status", "employer_name", "job_title", "soc_code", "soc_title",
-                "worksite_city", "worksite_state", "wage_unit"]:
+    for col in TEXT_COLS:
         df[col] = clean_text_series(df[col])
 
     df["worksite_state"] = df["worksite_state"].astype("string").str.upper().str.strip()
@@ -237,43 +471,279 @@ def load_and_clean(df: pd.DataFrame) -> pd.DataFrame:
     df["wage_annual"] = compute_wage_annual(df["wage_rate_from"], df["wage_rate_to"], df["wage_unit"])
 
     # drop rows without PK
-    df = df[df["case_number"].notna()].copy()
+    df = df[df["case_number"].notna()]
 
     return df
 
 
-def write_copy_csv(df: pd.DataFrame, out_path: str) -> None:
-    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+def _pl_clean_text(col: str) -> "pl.Expr":
+    e = pl.col(col).str.strip_chars()
+    return pl.when(e.is_in(["", "nan", "NaN", "NONE", "None"])).then(None).otherwise(e).alias(col)
+
+
+# Formats the polars engine recognises, tried in order; the pandas engine additionally
+# falls back to dateutil (format="mixed") for anything else. %.f also matches no fraction.
+PL_DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%Y-%m-%d %H:%M:%S%.f",
+    "%Y-%m-%dT%H:%M:%S%.f",
+    "%m/%d/%Y",
+    "%m/%d/%Y %H:%M:%S%.f",
+    "%m/%d/%y",
+    "%Y/%m/%d",
+    "%b %d, %Y",
+    "%B %d, %Y",
+    "%d-%b-%Y",
+)
+
+
+def _pl_parse_date(col: str) -> "pl.Expr":
+    # Explicit formats rather than one inferred format: DOL files mix ISO datetimes,
+    # MM/DD/YYYY strings and Excel serials within a single column.
+    e = pl.col(col).str.strip_chars()
+    serial = e.cast(pl.Float64, strict=False)
+
+    def in_range(d: "pl.Expr") -> "pl.Expr":
+        # chrono's %Y takes any digit count (01/05/23 is year 23 under %m/%d/%Y), so each
+        # format only counts within what pandas' datetime64[ns] can hold; later formats
+        # get the rest, and out-of-range values are NULL in both engines
+        return pl.when(d.is_between(dt.date(1677, 9, 22), dt.date(2262, 4, 11))).then(d)
+
+    return pl.coalesce(
+        *[in_range(e.str.to_datetime(fmt, strict=False).dt.date()) for fmt in PL_DATE_FORMATS],
+        pl.when(serial.is_between(18000, 60000) & (serial % 1 == 0))
+        .then(pl.lit(dt.date(1899, 12, 30)) + pl.duration(days=serial.cast(pl.Int64))),
+    ).alias(col)
+
+
+def load_and_clean_polars(lf: "pl.LazyFrame") -> "pl.LazyFrame":
+    """Polars equivalent of load_and_clean; source columns are String, or Datetime for date columns."""
+    schema = lf.collect_schema()
+    sources: Dict[str, List[str]] = {}
+    for c, target in _build_rename_map(tuple(schema.names())).items():
+        sources.setdefault(target, []).append(c)
+
+    def as_string(c: str) -> "pl.Expr":
+        # parquet caches written by the pandas path keep all-date columns as datetimes
+        if schema[c].is_temporal():
+            return pl.col(c).dt.strftime("%Y-%m-%d")
+        return pl.col(c).cast(pl.String)
+
+    # Rename + coalesce duplicates (first non-null, left-to-right) in a single projection
+    lf = lf.select([
+        pl.coalesce([as_string(c) for c in sources[col]]).alias(col)
+        if col in sources else pl.lit(None, dtype=pl.String).alias(col)
+        for col in TARGET_COLS
+        if col not in ("wage_annual", "year")
+    ])
+
+    lf = lf.with_columns([_pl_clean_text(c) for c in TEXT_COLS])
+    lf = lf.with_columns(
+        pl.col("worksite_state").str.to_uppercase(),
+        *[
+            pl.col(c).str.replace_all(_MONEY.pattern, "").str.strip_chars().cast(pl.Float64, strict=False)
+            for c in ("wage_rate_from", "wage_rate_to")
+        ],
+        *[_pl_parse_date(c) for c in ("received_date", "decision_date")],
+        pl.col("wage_unit")
+        .str.to_lowercase()
+        .str.replace_all(_NONWORD.pattern, "_")
+        .str.replace_all(_UNDERS.pattern, "_")
+        .str.strip_chars("_")
+        .replace(WAGE_UNIT_ALIASES)
+        .alias("_unit_norm"),
+    )
+
+    factors = pl.LazyFrame(
+        {"_unit_norm": list(WAGE_FACTORS), "_wage_factor": list(WAGE_FACTORS.values())},
+        schema={"_unit_norm": pl.String, "_wage_factor": pl.Float64},
+    )
+    lf = lf.join(factors, on="_unit_norm", how="left", maintain_order="left")
 
-    out = df.copy()
+    annual = pl.coalesce("wage_rate_from", "wage_rate_to") * pl.col("_wage_factor")
+    lf = lf.with_columns(
+        # Guardrails: drop absurd values
+        pl.when(annual.is_between(1000, 5_000_000)).then(annual.round(2)).alias("wage_annual"),
+        pl.col("decision_date").dt.year().cast(pl.Int64).alias("year"),
+    )
+
+    # drop rows without PK
+    return lf.filter(pl.col("case_number").is_not_null()).select(TARGET_COLS)
+
+
+def write_copy_csv(df: pd.DataFrame, out_path: str) -> None:
+    """Caller creates the output directory (main() does it once, before any worker starts)."""
+    # Format dates on the Arrow side instead of copying the frame; nulls are written
+    # unquoted as \N by the CSV writer, so no pd.NA -> NaN sweep is needed either.
+    table = pa.Table.from_pandas(df, preserve_index=False)
     for dcol in ["received_date", "decision_date"]:
-        out[dcol] = out[dcol].dt.strftime("%Y-%m-%d")
+        i = table.schema.get_field_index(dcol)
+        table = table.set_column(i, dcol, pc.strftime(table.column(i), format="%Y-%m-%d"))
 
-    out = out.replace({pd.NA: np.nan})
-    out.to_csv(
+    pa_csv.write_csv(
+        table,
         out_path,
-        index=False,
-        encoding="utf-8",
-        na_rep="\\N",
-        lineterminator="\n",
+        write_options=pa_csv.WriteOptions(null_string="\\N", quoting_style="needed"),
     )
 
 
 def parse_fy_q(filename: str) -> Tuple[Optional[int], Optional[int]]:
-    m = re.search(r"FY(\d{4})_Q([1-4])", filename, flags=re.IGNORECASE)
+    m = _FY_Q.search(filename)
     if not m:
         return None, None
     return int(m.group(1)), int(m.group(2))
 
 
+def make_pool(workers: Optional[int]) -> ProcessPoolExecutor:
+    # spawn (not fork) keeps polars' thread pool safe inside the workers
+    return ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context("spawn"))
+
+
+def manifest_row(
+    fname: str,
+    out_path: str,
+    cache_hit: bool,
+    input_rows: int,
+    output_rows: int,
+    min_dd: Optional[dt.date],
+    max_dd: Optional[dt.date],
+    wage_annual_nonnull: int,
+) -> dict:
+    """Build (and log) the manifest row for one cleaned file."""
+    fy, q = parse_fy_q(fname)
+    source = "parquet cache" if cache_hit else "xlsx"
+    print(f"Cleaned {fname} ({source}): {input_rows:,} -> {output_rows:,} | wrote {out_path}")
+    return {
+        "file": fname,
+        "fy_in_name": fy,
+        "q_in_name": q,
+        "cache_hit": cache_hit,
+        "input_rows": int(input_rows),
+        "output_rows": int(output_rows),
+        "decision_date_min": None if min_dd is None else str(min_dd),
+        "decision_date_max": None if max_dd is None else str(max_dd),
+        "wage_annual_nonnull": int(wage_annual_nonnull),
+        "output_csv": out_path,
+    }
+
+
+def out_csv_path(fname: str, out_dir: str) -> str:
+    out_name = fname.replace(".xlsx", ".csv").replace(".XLSX", ".csv")
+    return os.path.join(out_dir, out_name)
+
+
+def process_one(fname: str, in_dir: str, out_dir: str, sheet: int | str) -> dict:
+    """Clean one input file with pandas and return its manifest row."""
+    in_path = os.path.join(in_dir, fname)
+    out_path = out_csv_path(fname, out_dir)
+
+    df = read_cached_parquet(in_path, sheet)
+    cache_hit = df is not None
+    if df is None:
+        df = cache_xlsx_as_parquet(in_path, sheet=sheet)
+
+    cleaned = load_and_clean(df)
+    write_copy_csv(cleaned, out_path)
+
+    min_dd = cleaned["decision_date"].min()
+    max_dd = cleaned["decision_date"].max()
+    return manifest_row(
+        fname,
+        out_path,
+        cache_hit=cache_hit,
+        input_rows=len(df),
+        output_rows=len(cleaned),
+        min_dd=None if pd.isna(min_dd) else min_dd.date(),
+        max_dd=None if pd.isna(max_dd) else max_dd.date(),
+        wage_annual_nonnull=cleaned["wage_annual"].notna().sum(),
+    )
+
+
+def prepare_cache(fname: str, in_dir: str, sheet: int | str, scratch_dir: str) -> Tuple[str, bool]:
+    """
+    Make sure a fresh parquet copy of the file exists. Returns (parquet_path, cache_hit);
+    the path is under scratch_dir (valid for this run only) when in_dir is not writable.
+    """
+    in_path = os.path.join(in_dir, fname)
+    cache_path = parquet_sibling(in_path)
+    if cache_is_fresh(in_path, sheet):
+        return cache_path, True
+    _, table = xlsx_to_table(in_path, sheet)
+    if not write_parquet(table, cache_path):
+        cache_path = os.path.join(scratch_dir, fname + ".parquet")
+        pq.write_table(table, cache_path, compression="zstd")
+    return cache_path, False
+
+
+def clean_all_polars(files: List[str], in_dir: str, out_dir: str, sheet: int | str, workers: Optional[int]) -> List[dict]:
+    """
+    Batch polars path: materialize the xlsx -> parquet caches (in parallel, one process per
+    file), then build one lazy scan -> clean -> sink_csv plan per file and run them all in a
+    single pl.collect_all call; the manifest aggregates are read back from the sunk CSVs.
+    """
+    with tempfile.TemporaryDirectory(prefix="lca_parquet_") as scratch_dir:
+        with make_pool(workers) as ex:
+            prepared = list(ex.map(prepare_cache, files, repeat(in_dir), repeat(sheet), repeat(scratch_dir)))
+
+        sinks = [
+            load_and_clean_polars(pl.scan_parquet(cache_path)).sink_csv(
+                out_csv_path(fname, out_dir),
+                null_value="\\N",
+                date_format="%Y-%m-%d",
+                batch_size=65536,
+                lazy=True,
+            )
+            for fname, (cache_path, _) in zip(files, prepared)
+        ]
+        pl.collect_all(sinks)
+
+        # Manifest aggregates come from the written CSVs: collect_all doesn't share the
+        # scan -> clean work between plans, so a stats plan on the cleaned frame would
+        # clean every file twice.
+        results = pl.collect_all([
+            pl.scan_csv(out_csv_path(fname, out_dir), infer_schema=False, null_values="\\N").select(
+                pl.len().alias("output_rows"),
+                pl.col("decision_date").str.to_date("%Y-%m-%d").min().alias("decision_date_min"),
+                pl.col("decision_date").str.to_date("%Y-%m-%d").max().alias("decision_date_max"),
+                pl.col("wage_annual").count().alias("wage_annual_nonnull"),
+            )
+            for fname in files
+        ])
+
+        rows = []
+        for fname, (cache_path, cache_hit), stats in zip(files, prepared, results):
+            stats = stats.row(0, named=True)
+            rows.append(manifest_row(
+                fname,
+                out_csv_path(fname, out_dir),
+                cache_hit=cache_hit,
+                input_rows=pq.read_metadata(cache_path).num_rows,
+                output_rows=stats["output_rows"],
+                min_dd=stats["decision_date_min"],
+                max_dd=stats["decision_date_max"],
+                wage_annual_nonnull=stats["wage_annual_nonnull"],
+            ))
+    return rows
+
+
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--input-dir", required=True)
     ap.add_argument("--output-dir", required=True)
     ap.add_argument("--sheet", default=0)
     ap.add_argument("--pattern", default=r".*\.xlsx$", help="regex to match files (default: .*\\.xlsx$)")
+    ap.add_argument("--engine", choices=["pandas", "polars"], default="pandas",
+                    help="dataframe library used for cleaning (default: pandas); polars only parses "
+                         "ISO, M/D/YYYY, M/D/YY, YYYY/MM/DD, 'Jan 5, 2023' and 05-JAN-2023 dates "
+                         "and Excel serials (see PL_DATE_FORMATS)")
+    ap.add_argument("--workers", type=int, default=os.cpu_count(),
+                    help="files cleaned in parallel, one process each (default: CPU count)")
     args = ap.parse_args()
 
+    if args.engine == "polars" and pl is None:
+        print("--engine polars requires polars (pip install polars)")
+        return 1
+
     in_dir = args.input_dir
     out_dir = args.output_dir
     sheet = int(args.sheet) if str(args.sheet).isdigit() else args.sheet
@@ -291,45 +761,16 @@ def main() -> int:
 
     files.sort(key=sort_key)
 
-    manifest_rows = []
-    for fname in files:
-        in_path = os.path.join(in_dir, fname)
-        fy, q = parse_fy_q(fname)
-
-        usecols = infer_usecols_from_xlsx(in_path, sheet=sheet)
-
-        df = pd.read_excel(
-            in_path,
-            sheet_name=sheet,
-            engine="openpyxl",
-            dtype="string",
-            usecols=usecols,
-        )
-
-        cleaned = load_and_clean(df)
-
-        out_name = fname.replace(".xlsx", ".csv").replace(".XLSX", ".csv")
-        out_path = os.path.join(out_dir, out_name)
-        write_copy_csv(cleaned, out_path)
-
-        min_dd = cleaned["decision_date"].min()
-        max_dd = cleaned["decision_date"].max()
-
-        manifest_rows.append({
-            "file": fname,
-            "fy_in_name": fy,
-            "q_in_name": q,
-            "input_rows": int(len(df)),
-            "output_rows": int(len(cleaned)),
-            "decision_date_min": None if pd.isna(min_dd) else str(min_dd.date()),
-            "decision_date_max": None if pd.isna(max_dd) else str(max_dd.date()),
-            "wage_annual_nonnull": int(cleaned["wage_annual"].notna().sum()),
-            "output_csv": out_path,
-        })
+    # Once, up front: writers (and the polars sinks) assume the directory exists
+    os.makedirs(out_dir, exist_ok=True)
 
-        print(f"Cleaned {fname}: {len(df):,} -> {len(cleaned):,} | wrote {out_path}")
+    if args.engine == "polars":
+        manifest_rows = clean_all_polars(files, in_dir, out_dir, sheet, workers=args.workers)
+    else:
+        # Files are independent: one worker process per file, no shared state.
+        with make_pool(args.workers) as ex:
+            manifest_rows = list(ex.map(process_one, files, repeat(in_dir), repeat(out_dir), repeat(sheet)))
 
-    os.makedirs(out_dir, exist_ok=True)
     manifest = pd.DataFrame(manifest_rows)
     manifest_path = os.path.join(out_dir, "manifest.csv")
     manifest.to_csv(manifest_path, index=False)
@@ -3,40 +3,74 @@ r"""
 Clean a DOL LCA disclosure Excel (.xlsx) "case-only" file into a COPY-friendly CSV for Supabase/Postgres.
 
 Features
-- Reads .xlsx (optionally only needed columns to reduce memory)
+- Reads .xlsx with the calamine engine, in one pass over only the needed columns
+- Streams .csv input block by block through pyarrow's CSV reader/writer
 - Normalizes column names to your DB fields
 - Safely parses dates (handles strings AND Excel serial dates)
 - Computes year from decision_date
 - Computes wage_annual from wage_rate_from (or other strategy) + wage_unit
-- Outputs CSV using \N for NULL (ideal for COPY ... NULL '\N')
+- Outputs CSV using \N for NULL (ideal for COPY ... NULL '\N'), via polars' multi-threaded
+  CSV writer when polars is installed (pyarrow's otherwise)
+
+Requires pandas>=2.2, pyarrow and python-calamine (polars optional, for faster writes):
+  pip install pandas pyarrow python-calamine polars
+Without python-calamine, .xlsx input is read with openpyxl in read-only mode (much slower).
 
 Usage examples
   python clean_lca_xlsx_to_csv.py --input data/LCA_Disclosure.xlsx --output output/clean_lca_cases.csv
   python clean_lca_xlsx_to_csv.py --input data/LCA_Disclosure.xlsx --sheet 0 --wage-strategy avg
-  python clean_lca_xlsx_to_csv.py --input data/LCA_Disclosure.csv --output output/clean_lca_cases.csv --chunksize 250000
+  python clean_lca_xlsx_to_csv.py --input data/LCA_Disclosure.csv --output output/clean_lca_cases.csv --block-mb 128
 """
 
 from __future__ import annotations
 
 import argparse
+import collections
+import csv
+import functools
 import os
 import re
 import sys
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+
+try:
+    import python_calamine  # noqa: F401  (backs pandas' engine="calamine")
+    HAVE_CALAMINE = True
+except ImportError:  # fall back to openpyxl in read-only mode
+    HAVE_CALAMINE = False
+
+try:
+    import numexpr as ne
+except ImportError:  # optional: fused multiply + guardrail in compute_wage_annual
+    ne = None
+
+try:
+    import polars as pl
+except ImportError:  # optional: faster CSV writer for the xlsx path
+    pl = None
 
 
 # -----------------------------
 # Column normalization / mapping
 # -----------------------------
 
+# Compiled once; reused by norm_col and the vectorized pandas cleaners
+_NONWORD = re.compile(r"[^\w]+")
+_UNDERS = re.compile(r"_+")
+_MONEY = re.compile(r"[\$,]")
+
+
 def norm_col(name: str) -> str:
     """Normalize a source column name to a canonical token."""
     s = str(name).strip().lower()
-    s = re.sub(r"[^\w]+", "_", s)        # non-word -> underscore
-    s = re.sub(r"_+", "_", s).strip("_")
+    s = _NONWORD.sub("_", s)        # non-word -> underscore
+    s = _UNDERS.sub("_", s).strip("_")
     return s
 
 
@@ -133,6 +167,28 @@ WAGE_FACTORS = {
     "daily": 260.0,
 }
 
+# Normalized wage-unit spellings -> canonical WAGE_FACTORS key
+WAGE_UNIT_ALIASES: Dict[str, str] = {
+    "biweekly": "bi_weekly",
+    "semi_month": "semi_monthly",
+    "hr": "hour", "per_hour": "hour",
+    "wk": "week", "per_week": "week",
+    "mo": "month", "per_month": "month",
+    "yr": "year", "per_year": "year", "annual": "year",
+    "daily": "day", "per_day": "day",
+}
+
+
+# Formats tried as a fast path before falling back to per-element inference.
+# DOL files are overwhelmingly one of these; calamine renders datetime cells as the second.
+DATE_FAST_FORMATS: List[Tuple[re.Pattern, str]] = [
+    (re.compile(r"\d{4}-\d{2}-\d{2}"), "%Y-%m-%d"),
+    (re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}"), "%Y-%m-%d %H:%M:%S"),
+    (re.compile(r"\d{2}/\d{2}/\d{4}"), "%m/%d/%Y"),
+]
+DATE_SAMPLE_SIZE = 256
+DATE_FAST_THRESHOLD = 0.95
+
 
 def clean_text_series(s: pd.Series) -> pd.Series:
     """Trim strings; convert empty/whitespace-only to NaN."""
@@ -149,9 +205,23 @@ def coerce_numeric_series(s: pd.Series) -> pd.Series:
     if s is None:
         return s
     s = s.astype("string")
-    s = s.str.replace(r"[\$,]", "", regex=True).str.strip()
+    s = s.str.replace(_MONEY, "", regex=True).str.strip()
     s = s.replace({"": pd.NA})
-    return pd.to_numeric(s, errors="coerce")
+    # Always Float64, even when every value is integral. The polars xlsx writer prints such
+    # wages as 26.0; the pyarrow writers (CSV streaming, xlsx without polars) print 26
+    return pd.to_numeric(s, errors="coerce").astype("Float64")
+
+
+def detect_date_format(ss: pd.Series) -> Optional[str]:
+    """Return the strptime format matched by >95% of a leading sample of values, if any."""
+    sample = ss.dropna().head(DATE_SAMPLE_SIZE).tolist()
+    if not sample:
+        return None
+    for pattern, fmt in DATE_FAST_FORMATS:
+        hits = sum(1 for v in sample if pattern.fullmatch(v))
+        if hits > DATE_FAST_THRESHOLD * len(sample):
+            return fmt
+    return None
 
 
 def parse_mixed_date_series(s: pd.Series) -> pd.Series:
@@ -164,19 +234,31 @@ def parse_mixed_date_series(s: pd.Series) -> pd.Series:
     if s is None:
         return s
 
+    # The reader already produced datetimes (all-date Excel column): nothing to parse
+    if pd.api.types.is_datetime64_any_dtype(s):
+        return s
+
     # Work with strings to avoid pandas interpreting numeric as unix ns
     ss = s.astype("string").str.strip()
     ss = ss.replace({"": pd.NA, "nan": pd.NA, "NaN": pd.NA})
 
-    # Detect likely Excel serial numbers (roughly year 1950-2050)
-    # Excel date origin for Windows: 1899-12-30
-    is_serial = ss.str.fullmatch(r"\d{4,6}")  # 4-6 digits
-    serial_vals = pd.to_numeric(ss.where(is_serial), errors="coerce")
-
-    out = pd.to_datetime(ss, errors="coerce", infer_datetime_format=True)
+    fmt = detect_date_format(ss)
+    if fmt is None:
+        # No dominant format: parse element-wise rather than guessing one from the first value
+        out = pd.to_datetime(ss, format="mixed", errors="coerce", cache=True)
+    else:
+        # Happy path: one explicit format; leftovers are parsed element-wise (format="mixed")
+        out = pd.to_datetime(ss, format=fmt, errors="coerce", cache=True)
+        residual = out.isna() & ss.notna()
+        if residual.any():
+            out.loc[residual] = pd.to_datetime(
+                ss.loc[residual], format="mixed", errors="coerce", cache=True
+            )
 
-    # Convert serials where normal parsing failed
-    needs_serial = out.isna() & serial_vals.notna() & serial_vals.between(18000, 60000)
+    # Convert Excel serials (whole numbers, roughly year 1950-2050) where normal parsing failed.
+    # Excel date origin for Windows: 1899-12-30
+    serial_vals = pd.to_numeric(ss, errors="coerce")
+    needs_serial = out.isna() & serial_vals.between(18000, 60000) & (serial_vals % 1 == 0)
     if needs_serial.any():
         out.loc[needs_serial] = pd.to_datetime(
             serial_vals.loc[needs_serial],
@@ -188,32 +270,40 @@ def parse_mixed_date_series(s: pd.Series) -> pd.Series:
     return out
 
 
-def normalize_wage_unit(u: Optional[str]) -> Optional[str]:
-    """Normalize wage unit tokens to keys used in WAGE_FACTORS."""
-    if u is None or (isinstance(u, float) and np.isnan(u)):
-        return None
-    s = str(u).strip().lower()
-    s = re.sub(r"[^\w]+", "_", s)
-    s = re.sub(r"_+", "_", s).strip("_")
-
-    # Common DOL variants
-    # e.g., "BI-WEEKLY", "Bi-Weekly", "BI_WEEKLY"
-    if s in ("bi_weekly", "biweekly"):
-        return "bi_weekly"
-    if s in ("semi_monthly", "semi_month"):
-        return "semi_monthly"
-    if s in ("hour", "hr", "per_hour"):
-        return "hour"
-    if s in ("week", "wk", "per_week"):
-        return "week"
-    if s in ("month", "mo", "per_month"):
-        return "month"
-    if s in ("year", "yr", "per_year", "annual"):
-        return "year"
-    if s in ("day", "daily", "per_day"):
-        return "day"
-
-    return s or None
+def normalize_wage_unit_series(u: pd.Series) -> pd.Series:
+    """Normalize wage unit tokens to keys used in WAGE_FACTORS (vectorized; no per-row Python)."""
+    s = (
+        u.astype("string").str.strip().str.lower()
+        .str.replace(_NONWORD, "_", regex=True)
+        .str.replace(_UNDERS, "_", regex=True)
+        .str.strip("_")
+        .replace({"": pd.NA})
+    )
+    # Common DOL variants, e.g. "BI-WEEKLY", "Bi-Weekly", "BI_WEEKLY", "Per Hour"
+    return s.map(WAGE_UNIT_ALIASES).fillna(s)
+
+
+WAGE_ANNUAL_EXPR = "where((base * f >= 1000) & (base * f <= 5000000), base * f, nan)"
+
+
+def annualize(base: pd.Series, factors: pd.Series) -> pd.Series:
+    """
+    base * factor, with out-of-range results (outside 1,000-5,000,000) set to NA.
+    With numexpr the multiply, both comparisons and the select run as one fused pass
+    over the arrays instead of materializing four intermediate Series.
+    """
+    if ne is not None:
+        annual = ne.evaluate(WAGE_ANNUAL_EXPR, local_dict={
+            "base": base.to_numpy(dtype="float64", na_value=np.nan),
+            "f": factors.to_numpy(dtype="float64", na_value=np.nan),
+            "nan": np.nan,
+        })
+        # NaN (missing input, or failed guardrail) comes back as pd.NA
+        return pd.Series(annual, index=base.index, dtype="Float64")
+
+    annual = base * factors
+    # Guardrails: drop absurd values (tune as you like)
+    return annual.where((annual.isna()) | ((annual >= 1000) & (annual <= 5_000_000)), pd.NA)
 
 
 def compute_wage_annual(
@@ -228,53 +318,104 @@ def compute_wage_annual(
       - avg:  average of from/to (when both present) annualized
       - max:  max(from,to) annualized
     """
-    unit_norm = wage_unit.apply(normalize_wage_unit).astype("string")
+    unit_norm = normalize_wage_unit_series(wage_unit)
+
+    # Nullable Float64 inputs (pd.NA, masked-array kernels); no astype(float) copies
+    wage_from = wage_from.astype("Float64")
+    wage_to = wage_to.astype("Float64")
 
     if strategy == "avg":
-        base = wage_from.where(wage_from.notna(), np.nan)
-        both = wage_from.notna() & wage_to.notna()
-        base = base.astype(float)
-        base.loc[both] = ((wage_from.loc[both] + wage_to.loc[both]) / 2.0).astype(float)
-        base = pd.Series(base, index=wage_from.index)
+        # average when both present, otherwise wage_from
+        base = ((wage_from + wage_to) / 2.0).fillna(wage_from)
     elif strategy == "max":
-        base = pd.concat([wage_from, wage_to], axis=1).max(axis=1, skipna=True)
+        base = pd.concat([wage_from, wage_to], axis=1).max(axis=1, skipna=True).astype("Float64")
     else:
-        base = wage_from.where(wage_from.notna(), wage_to)
+        base = wage_from.fillna(wage_to)
 
-    # Apply factor
-    factors = unit_norm.map(lambda x: WAGE_FACTORS.get(str(x), np.nan))
-    annual = base.astype(float) * factors.astype(float)
-
-    # Guardrails: drop absurd values (tune as you like)
-    annual = annual.where((annual.isna()) | ((annual >= 1000) & (annual <= 5_000_000)), np.nan)
-    return annual
+    # Apply factor + guardrails
+    factors = unit_norm.map(WAGE_FACTORS).astype("Float64")
+    return annualize(base, factors)
 
 
 # -----------------------------
 # I/O strategies (xlsx vs csv chunks)
 # -----------------------------
 
-def infer_usecols_from_xlsx(path: str, sheet: int | str = 0) -> Tuple[Optional[List[str]], Dict[str, str]]:
+def is_source_col(name) -> bool:
+    """usecols predicate: keep only the xlsx columns that map to a DB field."""
+    return norm_col(name) in SOURCE_TO_TARGET
+
+
+DATE_COLS = ("received_date", "decision_date")
+
+
+class _XlsxDtypes(collections.defaultdict):
     """
-    Peek at header row using openpyxl (via pandas) to select only relevant columns.
-    Returns (usecols_list_or_None, normalized_header_map).
+    read_excel dtypes picked by header name, so the column selection and the dtypes come
+    out of one read (a nrows=0 header peek still parses the whole sheet under calamine).
     """
-    try:
-        header_df = pd.read_excel(path, sheet_name=sheet, nrows=0, engine="openpyxl")
-        original_cols = list(header_df.columns)
-    except Exception:
-        return None, {}
 
-    norm_map = {c: norm_col(c) for c in original_cols}
+    def __missing__(self, name):
+        return None if SOURCE_TO_TARGET.get(norm_col(name)) in DATE_COLS else "string"
+
+
+def dedupe_header(header: Sequence) -> List:
+    """Rename repeated header names X, X.1, X.2, ... the way pandas' readers do."""
+    counts: Dict = collections.defaultdict(int)
+    out = []
+    for name in header:
+        if name is not None:
+            n = counts[name]
+            while n:
+                counts[name] = n + 1
+                name = f"{name}.{n}"
+                n = counts[name]
+            counts[name] = n + 1
+        out.append(name)
+    return out
+
 
-    needed_norm_sources = set(SOURCE_TO_TARGET.keys())
-    keep_cols = [c for c in original_cols if norm_map.get(c) in needed_norm_sources]
+def read_xlsx_openpyxl(path: str, sheet: int | str) -> pd.DataFrame:
+    """
+    Fallback reader when python-calamine is missing: openpyxl in read-only, values-only mode,
+    which skips the style/formula machinery pandas' openpyxl path still loads.
+    """
+    import openpyxl
+
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True, keep_links=False)
+    try:
+        ws = wb.worksheets[sheet] if isinstance(sheet, int) else wb[sheet]
+        rows = ws.iter_rows(values_only=True)
+        # Repeated headers become X.1, ... (as with calamine) so no two columns share a name
+        header = dedupe_header(next(rows, None) or ())
+        idx = [i for i, h in enumerate(header) if h is not None and is_source_col(h)]
+        data = [
+            tuple(r[i] if i < len(r) else None for i in idx)
+            for r in rows
+            if any(v is not None for v in r)  # read-only sheets can report trailing blank rows
+        ]
+    finally:
+        wb.close()
+    return pd.DataFrame(data, columns=[header[i] for i in idx])
+
+
+def read_xlsx(path: str, sheet: int | str) -> pd.DataFrame:
+    """
+    Read only the mapped columns with calamine. Non-date columns are read as strings (we coerce
+    ourselves); date columns keep the engine's native datetime64 when every cell is a date, and
+    fall back to strings when the column mixes dates, text and serials.
+    """
+    if HAVE_CALAMINE:
+        df = pd.read_excel(path, sheet_name=sheet, engine="calamine", dtype=_XlsxDtypes(), usecols=is_source_col)
+    else:
+        df = read_xlsx_openpyxl(path, sheet)
+
+    for c in df.columns:
+        if not pd.api.types.is_datetime64_any_dtype(df[c]):
+            df[c] = df[c].astype("string")
+    return df
 
-    # If we somehow found nothing, fall back to reading all columns
-    if not keep_cols:
-        return None, norm_map
 
-    return keep_cols, norm_map
 def coalesce_duplicate_columns(df: pd.DataFrame) -> pd.DataFrame:
     """
     If df has duplicate column names, coalesce duplicates by taking the first non-null value
@@ -283,36 +424,43 @@ def coalesce_duplicate_columns(df: pd.DataFrame) -> pd.DataFrame:
     if df.columns.is_unique:
         return df
 
-    out = {}
-    # pd.unique preserves first-seen order
-    for name in pd.unique(df.columns):
-        cols = df.loc[:, df.columns == name]
-        # cols is a DataFrame when duplicates exist; a Series when unique
-        if isinstance(cols, pd.Series):
-            out[name] = cols
-        else:
-            out[name] = cols.bfill(axis=1).iloc[:, 0]
-    return pd.DataFrame(out)
+    # Only the duplicated labels need coalescing; every other column passes through as-is.
+    dup = df.columns.duplicated()
+    return df.loc[:, ~dup].assign(**{
+        name: df[name].bfill(axis=1).iloc[:, 0]
+        for name in df.columns[dup].unique()
+    })
 
 
-def load_and_clean_dataframe(df: pd.DataFrame, wage_strategy: str) -> pd.DataFrame:
-    # Build a rename map: source_col -> target_col
+# Quarterly files share a handful of header layouts, so both lookups are memoized
+# on the tuple of column names. Callers must not mutate the returned values.
+@functools.lru_cache(maxsize=None)
+def _build_rename_map(cols: Tuple[str, ...]) -> Dict[str, str]:
+    """source_col -> target_col for every column whose normalized name we recognize."""
     rename_map: Dict[str, str] = {}
-    for c in df.columns:
+    for c in cols:
         nc = norm_col(c)
         if nc in SOURCE_TO_TARGET:
             rename_map[c] = SOURCE_TO_TARGET[nc]
+    return rename_map
 
-    df = df.rename(columns=rename_map)
+
+@functools.lru_cache(maxsize=None)
+def _missing_target_cols(cols: Tuple[str, ...]) -> Tuple[str, ...]:
+    present = set(cols)
+    return tuple(col for col in TARGET_COLS if col not in present)
+
+
+def load_and_clean_dataframe(df: pd.DataFrame, wage_strategy: str) -> pd.DataFrame:
+    df = df.rename(columns=_build_rename_map(tuple(df.columns)))
     dups = df.columns[df.columns.duplicated()].tolist()
     print("Duplicate columns after rename:", dups)
 
     df = coalesce_duplicate_columns(df)
 
     # Ensure all target columns exist
-    for col in TARGET_COLS:
-        if col not in df.columns:
-            df[col] = pd.NA
+    for col in _missing_target_cols(tuple(df.columns)):
+        df[col] = pd.NA
 
     # Keep only the columns we care about (plus duplicates will be handled later in SQL)
     df = df[TARGET_COLS].copy()
@@ -323,7 +471,8 @@ def load_and_clean_dataframe(df: pd.DataFrame, wage_strategy: str) -> pd.DataFra
 
     # State normalization (2-letter upper if present)
     df["worksite_state"] = df["worksite_state"].astype("string").str.upper().str.strip()
-    df["worksite_state"] = df["worksite_state"].replace({"": pd.NA})
+    # upper() turns a literal "none" into "NONE", so null it here rather than in a second text pass
+    df["worksite_state"] = df["worksite_state"].replace({"": pd.NA, "NONE": pd.NA})
 
     # Numerics
     df["wage_rate_from"] = coerce_numeric_series(df["wage_rate_from"])
@@ -344,37 +493,98 @@ def load_and_clean_dataframe(df: pd.DataFrame, wage_strategy: str) -> pd.DataFra
         strategy=wage_strategy,
     ).round(2)
 
-    # Final cleanup: empty strings -> NA across object/string cols
-    for col in ["case_number", "case_status", "employer_name", "job_title", "soc_code", "soc_title", "worksite_city", "worksite_state", "wage_unit"]:
-        df[col] = clean_text_series(df[col])
-
     # Drop rows without case_number (cannot upsert)
-    df = df[df["case_number"].notna()].copy()
+    df = df[df["case_number"].notna()]
 
     return df
 
 
 def write_csv_copy_friendly(df: pd.DataFrame, output_path: str) -> None:
-    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    # Output directory is created once in main()
+    if pl is None:
+        pa_csv.write_csv(to_copy_table(df), output_path, write_options=COPY_WRITE_OPTIONS)
+        return
+
+    # Polars' Rust writer; dates as YYYY-MM-DD, NULL as \N
+    out = pl.from_pandas(df[TARGET_COLS]).with_columns(
+        pl.col("received_date", "decision_date").cast(pl.Date)
+    )
+    out.write_csv(
+        output_path,
+        null_value="\\N",
+        line_terminator="\n",
+        date_format="%Y-%m-%d",
+        batch_size=65536,
+    )
 
-    # Convert datetime to date strings; keep NULL as \N
-    out = df.copy()
 
+# Fixed output schema so every streamed block writes the same CSV columns/types
+COPY_SCHEMA = pa.schema([
+    ("case_number", pa.string()),
+    ("case_status", pa.string()),
+    ("received_date", pa.string()),
+    ("decision_date", pa.string()),
+    ("employer_name", pa.string()),
+    ("job_title", pa.string()),
+    ("soc_code", pa.string()),
+    ("soc_title", pa.string()),
+    ("worksite_city", pa.string()),
+    ("worksite_state", pa.string()),
+    ("wage_rate_from", pa.float64()),
+    ("wage_rate_to", pa.float64()),
+    ("wage_unit", pa.string()),
+    ("wage_annual", pa.float64()),
+    ("year", pa.int64()),
+])
+
+# NULL as unquoted \N (strings are always quoted by pyarrow, which COPY accepts)
+COPY_WRITE_OPTIONS = pa_csv.WriteOptions(null_string="\\N", quoting_style="needed")
+
+
+def to_copy_table(df: pd.DataFrame) -> pa.Table:
+    """Convert a cleaned frame to an Arrow table with dates as YYYY-MM-DD strings."""
+    table = pa.Table.from_pandas(df[TARGET_COLS], preserve_index=False)
     for dcol in ["received_date", "decision_date"]:
-        # Keep as YYYY-MM-DD; NaT -> NA
-        out[dcol] = out[dcol].dt.strftime("%Y-%m-%d")
+        i = table.schema.get_field_index(dcol)
+        table = table.set_column(i, dcol, pc.strftime(table.column(i), format="%Y-%m-%d"))
+    # pandas may infer Int64 vs Float64 per block; pin the types
+    return table.cast(COPY_SCHEMA)
 
-    # Ensure pandas treats missing as NaN so na_rep works
-    out = out.replace({pd.NA: np.nan})
 
-    out.to_csv(
-        output_path,
-        index=False,
-        encoding="utf-8",
-        na_rep="\\N",
-        lineterminator="\n",
+def stream_clean_csv(in_path: str, out_path: str, wage_strategy: str, block_size: int) -> None:
+    """
+    Clean a large CSV block by block: pyarrow reads Arrow batches, each batch is cleaned
+    in pandas, and one CSVWriter appends the results to a single open output file.
+    """
+    with open(in_path, newline="", encoding="utf-8-sig") as f:
+        header = next(csv.reader(f))
+
+    # Read everything as strings (we coerce ourselves), and only the columns we map
+    keep = [c for c in header if norm_col(c) in SOURCE_TO_TARGET] or header
+    reader = pa_csv.open_csv(
+        in_path,
+        read_options=pa_csv.ReadOptions(block_size=block_size),
+        # Quoted multi-line cells (addresses, job titles) may straddle a block boundary
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={c: pa.string() for c in keep},
+            include_columns=keep,
+            strings_can_be_null=True,
+        ),
     )
 
+    try:
+        with pa_csv.CSVWriter(out_path, COPY_SCHEMA, write_options=COPY_WRITE_OPTIONS) as writer:
+            for batch in reader:
+                chunk = batch.to_pandas(types_mapper={pa.string(): pd.StringDtype()}.get)
+                cleaned = load_and_clean_dataframe(chunk, wage_strategy=wage_strategy)
+                writer.write_table(to_copy_table(cleaned))
+    except BaseException:
+        # Don't leave a truncated CSV behind for COPY to pick up
+        if os.path.exists(out_path):
+            os.remove(out_path)
+        raise
+
 
 def main() -> int:
     ap = argparse.ArgumentParser()
@@ -383,37 +593,22 @@ def main() -> int:
     ap.add_argument("--sheet", default=0, help="Excel sheet name or 0-based index (default: 0)")
     ap.add_argument("--wage-strategy", choices=["from", "avg", "max"], default="from",
                     help="How to choose base wage before annualizing (default: from)")
-    ap.add_argument("--chunksize", type=int, default=200000,
-                    help="If input is CSV, process in chunks (default: 200000 rows)")
+    ap.add_argument("--block-mb", type=int, default=64,
+                    help="If input is CSV, stream it in blocks of this many MB (default: 64)")
+    ap.add_argument("--chunksize", type=int, default=None,
+                    help="Deprecated and ignored (CSV input is streamed by --block-mb)")
     args = ap.parse_args()
 
+    if args.chunksize is not None:
+        print("Warning: --chunksize is deprecated and ignored; use --block-mb to size CSV blocks")
+
     in_path = args.input
     out_path = args.output
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
 
     if in_path.lower().endswith(".csv"):
-        # Chunked path (recommended for very large files)
-        first = True
-        os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
-
-        for chunk in pd.read_csv(in_path, dtype="string", chunksize=args.chunksize, low_memory=False):
-            cleaned = load_and_clean_dataframe(chunk, wage_strategy=args.wage_strategy)
-
-            # Convert dates to string before writing
-            for dcol in ["received_date", "decision_date"]:
-                cleaned[dcol] = cleaned[dcol].dt.strftime("%Y-%m-%d")
-
-            cleaned = cleaned.replace({pd.NA: np.nan})
-
-            cleaned.to_csv(
-                out_path,
-                mode="w" if first else "a",
-                header=first,
-                index=False,
-                encoding="utf-8",
-                na_rep="\\N",
-                lineterminator="\n",
-            )
-            first = False
+        # Streaming path (recommended for very large files); one CSVWriter stays open across blocks
+        stream_clean_csv(in_path, out_path, wage_strategy=args.wage_strategy, block_size=args.block_mb << 20)
 
         print(f"Done. Wrote: {out_path}")
         return 0
@@ -427,16 +622,8 @@ def main() -> int:
     except Exception:
         pass
 
-    usecols, _ = infer_usecols_from_xlsx(in_path, sheet=sheet)
-
-    # Read as strings to avoid type surprises; we will coerce ourselves.
-    df = pd.read_excel(
-        in_path,
-        sheet_name=sheet,
-        engine="openpyxl",
-        dtype="string",
-        usecols=usecols,   # None => all columns
-    )
+    # Only the mapped columns; non-date columns as strings to avoid type surprises
+    df = read_xlsx(in_path, sheet=sheet)
 
     cleaned = load_and_clean_dataframe(df, wage_strategy=args.wage_strategy)
     write_csv_copy_friendly(cleaned, out_path)